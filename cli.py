@@ -0,0 +1,205 @@
+"""
+Headless entry point for scripted GitHub queries, e.g.
+
+    python cli.py prs --concurrency 16 --format csv --fields repository,number,title,user.login
+
+Results are streamed to stdout one row at a time as JSONL (default) or CSV. Nothing from the
+Textual interface is imported, so start-up stays fast enough for cron jobs and CI.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_CONFIG = 3
+EXIT_PARTIAL = 4
+
+
+class _RowWriter:
+    def __init__(self, output_format: str, fields=None, stream=sys.stdout):
+        self.output_format = output_format
+        self.fields = fields
+        self.stream = stream
+        self._csv = None
+
+    def write(self, row):
+        if self.fields:
+            from github import GitHubResponse
+            row = GitHubResponse(row).getFields(self.fields).value()
+
+        if self.output_format == "csv":
+            if not isinstance(row, dict):
+                row = {"value": row}
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.stream, fieldnames=self.fields or list(row), extrasaction="ignore")
+                self._csv.writeheader()
+            self._csv.writerow({
+                k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in row.items()
+            })
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+        self.stream.flush()
+
+
+def _rows(data):
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+def _team_queries(config):
+    from github import TeamDataCache, TeamQueries
+    return TeamQueries(config.github, TeamDataCache(config.github.team))
+
+
+def cmd_config(args, config, writer):
+    from dataclasses import asdict
+    writer.write(asdict(config))
+    return EXIT_OK
+
+
+def cmd_teams(args, config, writer):
+    from github import GitHubTeamRequests
+    for row in _rows(GitHubTeamRequests(config.github.organisation, config.github.team).list_teams().data):
+        writer.write(row)
+    return EXIT_OK
+
+
+def cmd_members(args, config, writer):
+    from github import GitHubTeamRequests
+    for row in _rows(GitHubTeamRequests(config.github.organisation, config.github.team).get_team_members().data):
+        writer.write(row)
+    return EXIT_OK
+
+
+def cmd_repos(args, config, writer):
+    from github import GitHubTeamRequests
+    for row in _rows(GitHubTeamRequests(config.github.organisation, config.github.team).get_team_repos().data):
+        writer.write(row)
+    return EXIT_OK
+
+
+def _fan_out(args, config, writer, fetch):
+    from github.concurrency import iter_concurrently
+
+    repos = args.repos or _team_queries(config).active_repo_names()
+    status = EXIT_OK
+    for repo, rows, error in iter_concurrently(fetch, repos, args.concurrency):
+        if error is not None:
+            print(f"{repo}: {error}", file=sys.stderr)
+            status = EXIT_PARTIAL
+            continue
+        for row in _rows(rows):
+            writer.write({"repository": repo, **row} if isinstance(row, dict) else row)
+    return status
+
+
+def cmd_prs(args, config, writer):
+    from github import GitHubRepoRequests
+    return _fan_out(
+        args, config, writer,
+        lambda repo: GitHubRepoRequests(config.github.organisation, repo).list_pull_requests(args.state).data,
+    )
+
+
+def cmd_commits(args, config, writer):
+    from github import GitHubRepoRequests
+    return _fan_out(
+        args, config, writer,
+        lambda repo: GitHubRepoRequests(config.github.organisation, repo).list_commits(
+            since=args.since, until=args.until, author=args.author, path=args.path
+        ).data,
+    )
+
+
+def cmd_branches(args, config, writer):
+    from github import BranchHygiene
+
+    repos = [{"name": name} for name in args.repos] if args.repos else _team_queries(config).active_repos()
+
+    hygiene = BranchHygiene(config.github.organisation, stale_days=args.stale_days, max_workers=args.concurrency)
+    hygiene.scan(repos)
+    for repo, error in sorted(hygiene.failed.items()):
+        print(f"{repo}: {error}", file=sys.stderr)
+
+    for row in hygiene.report([repo["name"] for repo in repos if repo["name"] not in hygiene.failed]):
+        if args.status is None or row["status"] in args.status:
+            writer.write(row)
+    return EXIT_PARTIAL if hygiene.failed else EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run custom-tools GitHub queries without the TUI.")
+    parser.add_argument("--config", default=None, help="Path to config.yaml (defaults to the repository config).")
+    parser.add_argument("--organisation", help="Override the configured organisation.")
+    parser.add_argument("--team", help="Override the configured team slug.")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="Output format (default jsonl).")
+    parser.add_argument("--fields", help="Comma separated fields to output; dotted paths such as user.login are allowed.")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("config", help="Print the resolved configuration.").set_defaults(func=cmd_config)
+    subparsers.add_parser("teams", help="List organisation teams.").set_defaults(func=cmd_teams)
+    subparsers.add_parser("members", help="List team members.").set_defaults(func=cmd_members)
+    subparsers.add_parser("repos", help="List team repositories.").set_defaults(func=cmd_repos)
+
+    fan_out = argparse.ArgumentParser(add_help=False)
+    fan_out.add_argument("--concurrency", type=int, default=8, help="Repositories queried in parallel (default 8).")
+    fan_out.add_argument("--repos", nargs="+", help="Repositories to query instead of all active team repositories.")
+
+    prs = subparsers.add_parser("prs", parents=[fan_out], help="List pull requests across team repositories.")
+    prs.add_argument("--state", choices=("open", "closed", "all"), default="open")
+    prs.set_defaults(func=cmd_prs)
+
+    commits = subparsers.add_parser("commits", parents=[fan_out], help="List commits across team repositories.")
+    commits.add_argument("--since", help="ISO 8601 timestamp, e.g. 2024-01-01T00:00:00Z.")
+    commits.add_argument("--until", help="ISO 8601 timestamp.")
+    commits.add_argument("--author", help="GitHub login or email address.")
+    commits.add_argument("--path", help="Only commits touching this path.")
+    commits.set_defaults(func=cmd_commits)
+
+    branches = subparsers.add_parser("branches", parents=[fan_out], help="Report merged and stale branches.")
+    branches.add_argument("--stale-days", type=int, default=90, help="Days without commits before a branch is stale.")
+    branches.add_argument("--status", nargs="+", choices=("default", "merged", "stale", "active"))
+    branches.set_defaults(func=cmd_branches)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    import yaml
+    from config import YAMLConfig
+    try:
+        config = YAMLConfig(args.config).config
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return EXIT_CONFIG
+    except (yaml.YAMLError, ValueError, TypeError, AttributeError) as e:
+        print("Invalid config file: " + " ".join(str(e).split()), file=sys.stderr)
+        return EXIT_CONFIG
+
+    if args.organisation:
+        config.github.organisation = args.organisation
+    if args.team:
+        config.github.team = args.team
+
+    writer = _RowWriter(args.format, args.fields.split(",") if args.fields else None)
+    try:
+        return args.func(args, config, writer)
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); that is not a failure.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_OK
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
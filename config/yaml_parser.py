@@ -19,6 +19,7 @@ class YAMLConfig:
             organisation=github_data.get("organisation", ""),
             team=github_data.get("team", ""),
             ignored_repositories=github_data.get("ignored-repositories", []),
+            refresh_budget_share=float(github_data.get("refresh-budget-share", 0.2)),
         )
 
     def __get_local_config(self) -> "LocalConfig":
@@ -1,12 +1,30 @@
-from .client import GitHubClient, GitHubResponse
+from .client import GitHubClient, GitHubResponse, RateLimit, RequestCounter
 from .team_requests import GitHubTeamRequests
 from .pr_requests import GitHubPullRequestActions
 from .repo_requests import GitHubRepoRequests
+from .team_graph import TeamGraph
+from .team_cache import TeamDataCache
+from .webhooks import WebhookReceiver
+from .team_queries import TeamQueries
+from .scheduler import RefreshScheduler
+from .commit_activity import CommitActivity
+from .branch_hygiene import BranchHygiene
+from .snapshots import SnapshotStore
 
 __all__ = [
     "GitHubClient",
     "GitHubResponse",
+    "RateLimit",
+    "RequestCounter",
     "GitHubTeamRequests",
     "GitHubPullRequestActions",
-    "GitHubRepoRequests"
+    "GitHubRepoRequests",
+    "TeamGraph",
+    "TeamDataCache",
+    "WebhookReceiver",
+    "TeamQueries",
+    "RefreshScheduler",
+    "CommitActivity",
+    "BranchHygiene",
+    "SnapshotStore"
 ]
@@ -0,0 +1,182 @@
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+from config import Logger
+from .client import GitHubClient
+from .concurrency import iter_concurrently, DEFAULT_MAX_WORKERS
+from .repo_requests import GitHubRepoRequests
+
+GRAPHQL_BATCH_SIZE = 50
+
+
+def _branch_query(count: int) -> str:
+    # Ref.compare(headRef) compares from this branch to the default branch, so its aheadBy is how far
+    # the branch is behind the default and its behindBy is how far the branch is ahead.
+    variables = "".join(f", $b{i}: String!" for i in range(count))
+    refs = "".join(
+        f"""
+        b{i}: ref(qualifiedName: $b{i}) {{
+          target {{ ... on Commit {{ committedDate author {{ name user {{ login }} }} }} }}
+          compare(headRef: $default) {{ aheadBy behindBy }}
+        }}"""
+        for i in range(count)
+    )
+    return f"""
+    query($owner: String!, $name: String!, $default: String!{variables}) {{
+      repository(owner: $owner, name: $name) {{{refs}
+      }}
+    }}"""
+
+
+def _age_days(date: str) -> int:
+    committed = datetime.strptime(date, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - committed).days
+
+
+class BranchHygiene:
+    """
+    Finds merged and abandoned branches across repositories. Branch heads come from one REST listing
+    per repo; last-commit dates and ahead/behind counts for branches that moved (or whose default
+    branch moved) since the last scan come from batched GraphQL queries. Results are cached by head SHA.
+    """
+
+    DEFAULT_PATH = Path(".cache/branch_hygiene.json")
+
+    def __init__(self, organisation: str, stale_days: int = 90, path: Union[str, Path] = None, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.organisation = organisation
+        self.stale_days = stale_days
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._repos: Dict[str, dict] = {}
+        self.failed: Dict[str, str] = {}
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+
+        with self.path.open("r", encoding="utf-8") as f:
+            data = json.load(f) or {}
+
+        if data.get("organisation") == self.organisation:
+            self._repos = data.get("repos", {})
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            text = json.dumps({"organisation": self.organisation, "repos": self._repos})
+
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(self.path)
+
+    def scan(self, repos: Iterable[dict]):
+        """
+        Scans repositories given as team repo listing entries. Entries without a default_branch have it
+        looked up. Repositories that could not be scanned are left in `failed` with their error.
+        """
+        repos = {repo["name"]: repo.get("default_branch") for repo in repos}
+        self.failed = {}
+
+        for repo, result, error in iter_concurrently(
+                lambda name: self._scan_repo(name, repos[name]), list(repos), self.max_workers
+        ):
+            if error is not None:
+                Logger.log(f"Scanning branches for {repo} failed: {error}")
+                self.failed[repo] = str(error)
+                continue
+            with self._lock:
+                self._repos[repo] = result
+
+        self.save()
+        return self
+
+    def _scan_repo(self, repo: str, default_branch: str = None) -> dict:
+        repo_requests = GitHubRepoRequests(self.organisation, repo)
+        if not default_branch:
+            default_branch = repo_requests.get_repo().value()["default_branch"]
+
+        heads = {
+            branch["name"]: (branch.get("commit") or {}).get("sha")
+            for branch in repo_requests.list_branches().value()
+        }
+        default_sha = heads.get(default_branch)
+
+        with self._lock:
+            cached = dict(self._repos.get(repo, {}).get("branches", {}))
+
+        branches = {}
+        moved = []
+        for name, sha in heads.items():
+            entry = cached.get(name)
+            if entry and entry["sha"] == sha and entry["default_sha"] == default_sha:
+                branches[name] = entry
+            else:
+                moved.append(name)
+
+        client = GitHubClient()
+        for start in range(0, len(moved), GRAPHQL_BATCH_SIZE):
+            batch = moved[start:start + GRAPHQL_BATCH_SIZE]
+            variables = {"owner": self.organisation, "name": repo, "default": f"refs/heads/{default_branch}"}
+            variables.update({f"b{i}": f"refs/heads/{name}" for i, name in enumerate(batch)})
+            response, errors = client.graphql_partial(_branch_query(len(batch)), variables)
+            result = response.value().get("repository")
+            if result is None:
+                raise Exception(f"GitHub GraphQL Error: {errors}")
+            if errors:
+                Logger.log(f"Scanning branches for {repo} returned errors: {errors}")
+
+            for i, name in enumerate(batch):
+                ref = result.get(f"b{i}")
+                if not ref or ref.get("compare") is None:
+                    # Deleted since the branch listing, or its compare failed; left out rather than
+                    # cached, so it is looked up again on the next scan.
+                    continue
+                target = ref.get("target") or {}
+                author = target.get("author") or {}
+                compare = ref["compare"]
+                branches[name] = {
+                    "sha": heads[name],
+                    "default_sha": default_sha,
+                    "last_commit": target.get("committedDate"),
+                    "author": (author.get("user") or {}).get("login") or author.get("name"),
+                    "ahead": compare.get("behindBy"),
+                    "behind": compare.get("aheadBy"),
+                }
+
+        return {"default_branch": default_branch, "branches": branches}
+
+    def status(self, branch: str, default_branch: str, entry: dict) -> str:
+        if branch == default_branch:
+            return "default"
+        if entry.get("ahead") == 0:
+            return "merged"
+        if entry.get("last_commit") and _age_days(entry["last_commit"]) >= self.stale_days:
+            return "stale"
+        return "active"
+
+    def report(self, repos: Iterable[str] = None) -> List[dict]:
+        with self._lock:
+            scanned = dict(self._repos)
+
+        rows = []
+        for repo in sorted(repos if repos is not None else scanned):
+            if repo not in scanned:
+                continue
+            default_branch = scanned[repo]["default_branch"]
+            for branch, entry in sorted(scanned[repo]["branches"].items()):
+                rows.append({
+                    "repository": repo,
+                    "branch": branch,
+                    "status": self.status(branch, default_branch, entry),
+                    "ahead": entry.get("ahead"),
+                    "behind": entry.get("behind"),
+                    "last_commit": entry.get("last_commit"),
+                    "age_days": _age_days(entry["last_commit"]) if entry.get("last_commit") else None,
+                    "author": entry.get("author"),
+                })
+        return rows
@@ -1,6 +1,8 @@
 import requests
+import contextvars
 import json
 import os
+import threading
 
 
 def _handle_response(response):
@@ -13,6 +15,14 @@ def _handle_response(response):
         raise Exception(f"GitHub API Error {response.status_code}: {response.text}")
 
 
+def _next_link(response):
+    link = response.headers.get("Link", "")
+    for part in link.split(","):
+        if 'rel="next"' in part:
+            return part[part.find("<") + 1:part.find(">")]
+    return None
+
+
 def _get_nested(item, path):
     keys = path.split(".")
     value = item
@@ -24,6 +34,68 @@ def _get_nested(item, path):
     return value
 
 
+_request_counter = contextvars.ContextVar("github_request_counter", default=None)
+
+
+class RequestCounter:
+    """
+    Counts the billable requests made inside a `with` block, including those made by pool workers the
+    block fans out to, so concurrent callers are not billed for each other's requests.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._token = None
+
+    def __enter__(self):
+        self._token = _request_counter.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _request_counter.reset(self._token)
+
+    def add(self):
+        with self._lock:
+            self.count += 1
+
+
+class _RateLimitSingleton:
+    """Rate-limit state shared by every client, taken from the X-RateLimit headers of the latest response."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance.limit = 5000
+                cls._instance.remaining = None
+                cls._instance.reset = None
+                cls._instance.requests_made = 0
+                cls._instance._update_lock = threading.Lock()
+            return cls._instance
+
+    def record(self, response):
+        headers = response.headers
+        # 304 Not Modified answers to conditional requests are not charged against the rate limit.
+        billable = response.status_code != 304
+        counter = _request_counter.get()
+        if billable and counter is not None:
+            counter.add()
+        with self._update_lock:
+            if billable:
+                self.requests_made += 1
+            if "X-RateLimit-Limit" in headers:
+                self.limit = int(headers["X-RateLimit-Limit"])
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+                self.reset = int(headers["X-RateLimit-Reset"])
+
+
+RateLimit = _RateLimitSingleton()
+
+
 class GitHubResponse:
     def __init__(self, data):
         self.data = data
@@ -89,12 +161,17 @@ class GitHubClient:
             "Accept": "application/vnd.github+json"
         })
 
+    def _request(self, method: str, url: str, **kwargs):
+        response = self.session.request(method, url, **kwargs)
+        RateLimit.record(response)
+        return response
+
     def get(self, endpoint: str, params=None):
         url = f"{self.base_url}{endpoint}"
         results = []
 
         while url:
-            response = self.session.get(url, params=params)
+            response = self._request("GET", url, params=params)
             data = _handle_response(response)
 
             if isinstance(data, list):
@@ -102,34 +179,76 @@ class GitHubClient:
             else:
                 return GitHubResponse(data)
 
-            link = response.headers.get("Link", "")
-            next_url = None
-            for part in link.split(","):
-                if 'rel="next"' in part:
-                    next_url = part[part.find("<") + 1:part.find(">")]
-            url = next_url
+            url = _next_link(response)
             params = None
 
         return GitHubResponse(results)
 
+    def get_if_changed(self, endpoint: str, etag: str = None, params=None):
+        """
+        Conditional GET keyed on the ETag of the first page. Returns (None, etag) when GitHub answers
+        304 Not Modified, which does not count against the rate limit, otherwise (GitHubResponse, new_etag).
+        The ETag only describes the first page, so none is returned for listings spanning several pages
+        and those are always fetched in full.
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._request("GET", url, params=params, headers=headers)
+        if response.status_code == 304:
+            return None, etag
+
+        data = _handle_response(response)
+        new_etag = response.headers.get("ETag")
+        if not isinstance(data, list):
+            return GitHubResponse(data), new_etag
+
+        results = list(data)
+        url = _next_link(response)
+        if url:
+            new_etag = None
+        while url:
+            response = self._request("GET", url)
+            results.extend(_handle_response(response))
+            url = _next_link(response)
+
+        return GitHubResponse(results), new_etag
+
     def post(self, endpoint: str, data=None):
         url = f"{self.base_url}{endpoint}"
-        response = self.session.post(url, json=data)
+        response = self._request("POST", url, json=data)
         return GitHubResponse(_handle_response(response))
 
+    def graphql(self, query: str, variables: dict = None):
+        data, errors = self.graphql_partial(query, variables)
+        if errors:
+            raise Exception(f"GitHub GraphQL Error: {errors}")
+        return data
+
+    def graphql_partial(self, query: str, variables: dict = None):
+        """
+        Runs a GraphQL query, returning (GitHubResponse, errors). GitHub answers with partial data when
+        only some fields fail, so this only raises when no data came back at all.
+        """
+        response = self._request("POST", f"{self.base_url}/graphql", json={"query": query, "variables": variables or {}})
+        data = _handle_response(response)
+        errors = data.get("errors") or []
+        if data.get("data") is None:
+            raise Exception(f"GitHub GraphQL Error: {errors}")
+        return GitHubResponse(data["data"]), errors
+
     def patch(self, endpoint: str, data=None):
         url = f"{self.base_url}{endpoint}"
-        response = self.session.patch(url, json=data)
+        response = self._request("PATCH", url, json=data)
         return GitHubResponse(_handle_response(response))
 
     def put(self, endpoint: str, data=None):
         url = f"{self.base_url}{endpoint}"
-        response = self.session.put(url, json=data)
+        response = self._request("PUT", url, json=data)
         return GitHubResponse(_handle_response(response))
 
     def delete(self, endpoint: str):
         url = f"{self.base_url}{endpoint}"
-        response = self.session.delete(url)
+        response = self._request("DELETE", url)
         if response.status_code in (204, 200):
             return True
         return GitHubResponse(_handle_response(response))
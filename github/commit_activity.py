@@ -0,0 +1,263 @@
+import base64
+import json
+import threading
+from array import array
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+from config import Logger
+from .concurrency import iter_concurrently, DEFAULT_MAX_WORKERS
+from .repo_requests import GitHubRepoRequests
+
+WEEK_SECONDS = 7 * 24 * 3600
+SHA_BYTES = 20
+# 1970-01-05 was a Monday, so weeks are bucketed Monday to Sunday.
+WEEK_ORIGIN = 4 * 24 * 3600
+
+
+def _parse_timestamp(value: str) -> int:
+    return int(datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp())
+
+
+def _format_timestamp(value: int) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _week(timestamp: int) -> str:
+    start = timestamp - (timestamp - WEEK_ORIGIN) % WEEK_SECONDS
+    return datetime.fromtimestamp(start, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _commit_author(commit: dict) -> str:
+    login = (commit.get("author") or {}).get("login")
+    if login:
+        return login
+    return ((commit.get("commit") or {}).get("author") or {}).get("name") or "unknown"
+
+
+def _encode(values) -> str:
+    return base64.b64encode(bytes(values)).decode("ascii")
+
+
+def _decode(typecode: str, data: str) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(data))
+    return values
+
+
+class CommitActivity:
+    """
+    Commit history for a set of repositories, stored column-wise (repo index, author index, commit
+    timestamp, SHA) with repo and author names interned. Each update asks GitHub for commits since the
+    per-repo watermark minus `overlap_days`, bounded to the last `days` days, and skips SHAs it already
+    holds. The overlap picks up commits merged after the last run whose committer dates are older than
+    the watermark.
+    """
+
+    DEFAULT_PATH = Path(".cache/commit_activity.json")
+
+    def __init__(self, organisation: str, days: int = 90, overlap_days: int = 30, path: Union[str, Path] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        self.organisation = organisation
+        self.days = days
+        self.overlap_days = overlap_days
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self.repos: List[str] = []
+        self.authors: List[str] = []
+        self.repo_column = array("i")
+        self.author_column = array("i")
+        self.timestamp_column = array("q")
+        self.sha_column = bytearray()
+        self.watermarks: Dict[str, int] = {}
+        self.failed: Dict[str, str] = {}
+        self._seen = set()
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+
+        with self.path.open("r", encoding="utf-8") as f:
+            data = json.load(f) or {}
+
+        if data.get("organisation") != self.organisation:
+            return
+
+        timestamp_column = _decode("q", data["timestamp_column"])
+        sha_column = bytearray(base64.b64decode(data.get("sha_column", "")))
+        if len(sha_column) != len(timestamp_column) * SHA_BYTES:
+            # Written before SHAs were kept; refetch the window rather than double count.
+            return
+
+        self.repos = data["repos"]
+        self.authors = data["authors"]
+        self.repo_column = _decode("i", data["repo_column"])
+        self.author_column = _decode("i", data["author_column"])
+        self.timestamp_column = timestamp_column
+        self.sha_column = sha_column
+        self.watermarks = data["watermarks"]
+        self._seen = set(zip(self.repo_column, self._shas()))
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            text = json.dumps({
+                "organisation": self.organisation,
+                "repos": self.repos,
+                "authors": self.authors,
+                "repo_column": _encode(self.repo_column),
+                "author_column": _encode(self.author_column),
+                "timestamp_column": _encode(self.timestamp_column),
+                "sha_column": _encode(self.sha_column),
+                "watermarks": self.watermarks,
+            })
+
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(self.path)
+
+    def window_start(self) -> int:
+        return int((datetime.now(timezone.utc) - timedelta(days=self.days)).timestamp())
+
+    def update(self, repos: Iterable[str]):
+        """
+        Fetches recent commits for each repo concurrently and appends the ones not already stored.
+        Repositories whose commits could not be fetched are left in `failed` with their error.
+        """
+        window_start = self.window_start()
+        self.failed = {}
+        overlap = self.overlap_days * 24 * 3600
+
+        def fetch(repo):
+            since = max(window_start, self.watermarks.get(repo, 0) - overlap)
+            return GitHubRepoRequests(self.organisation, repo).list_commits(since=_format_timestamp(since)).data
+
+        for repo, commits, error in iter_concurrently(fetch, list(repos), self.max_workers):
+            if error is not None:
+                # Empty repositories answer 409 Conflict; they have no commits to miss.
+                Logger.log(f"Fetching commits for {repo} failed: {error}")
+                if "GitHub API Error 409" not in str(error):
+                    self.failed[repo] = str(error)
+                continue
+            self._append(repo, commits)
+
+        self._prune(window_start)
+        self.save()
+        return self
+
+    def _shas(self):
+        for offset in range(0, len(self.sha_column), SHA_BYTES):
+            yield bytes(self.sha_column[offset:offset + SHA_BYTES])
+
+    def _intern(self, names: List[str], index: Dict[str, int], name: str) -> int:
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+        return index[name]
+
+    def _append(self, repo: str, commits: list):
+        with self._lock:
+            repo_index = {name: i for i, name in enumerate(self.repos)}
+            author_index = {name: i for i, name in enumerate(self.authors)}
+            r = self._intern(self.repos, repo_index, repo)
+            watermark = self.watermarks.get(repo, 0)
+
+            for commit in commits:
+                date = (((commit.get("commit") or {}).get("committer") or {}).get("date"))
+                sha = bytes.fromhex(commit.get("sha") or "")
+                if not date or len(sha) != SHA_BYTES or (r, sha) in self._seen:
+                    continue
+                timestamp = _parse_timestamp(date)
+                self._seen.add((r, sha))
+                self.sha_column.extend(sha)
+                self.repo_column.append(r)
+                self.author_column.append(self._intern(self.authors, author_index, _commit_author(commit)))
+                self.timestamp_column.append(timestamp)
+                watermark = max(watermark, timestamp)
+
+            self.watermarks[repo] = watermark
+
+    def _prune(self, window_start: int):
+        with self._lock:
+            keep = [i for i, timestamp in enumerate(self.timestamp_column) if timestamp >= window_start]
+            if len(keep) == len(self.timestamp_column):
+                return
+            self.repo_column = array("i", (self.repo_column[i] for i in keep))
+            self.author_column = array("i", (self.author_column[i] for i in keep))
+            self.timestamp_column = array("q", (self.timestamp_column[i] for i in keep))
+            shas = list(self._shas())
+            self.sha_column = bytearray(b"".join(shas[i] for i in keep))
+            self._seen = {(self.repo_column[n], shas[i]) for n, i in enumerate(keep)}
+
+    def _group_by(self, key_column: array, key_names: List[str], members: Iterable[str] = None) -> Dict[str, Dict[str, int]]:
+        counts = Counter(zip(key_column, map(_week, self.timestamp_column)))
+        result = defaultdict(dict)
+        for (key, week), count in sorted(counts.items(), key=lambda kv: kv[0][1]):
+            result[key_names[key]][week] = count
+
+        if members is not None:
+            wanted = {m.lower() for m in members}
+            return {name: weeks for name, weeks in sorted(result.items()) if name.lower() in wanted}
+        return dict(sorted(result.items()))
+
+    def weekly_by_member(self, members: Iterable[str] = None) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return self._group_by(self.author_column, self.authors, members)
+
+    def weekly_by_repo(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return self._group_by(self.repo_column, self.repos)
+
+    def bus_factor(self, threshold: float = 0.5) -> Dict[str, dict]:
+        """Per repo, the fewest authors who between them made more than `threshold` of the commits."""
+        with self._lock:
+            counts = Counter(zip(self.repo_column, self.author_column))
+            repos, authors = list(self.repos), list(self.authors)
+
+        per_repo = defaultdict(list)
+        for (repo, author), count in counts.items():
+            per_repo[repo].append((count, authors[author]))
+
+        result = {}
+        for repo, contributions in per_repo.items():
+            contributions.sort(reverse=True)
+            total = sum(count for count, _ in contributions)
+            covered, key_authors = 0, []
+            for count, author in contributions:
+                key_authors.append(author)
+                covered += count
+                if covered > total * threshold:
+                    break
+            result[repos[repo]] = {"bus_factor": len(key_authors), "key_authors": key_authors, "commits": total}
+
+        return dict(sorted(result.items(), key=lambda kv: (kv[1]["bus_factor"], -kv[1]["commits"])))
+
+    def hot_spots(self, weeks: int = 4, top: int = 10) -> List[dict]:
+        """Repos with the most commits in the last `weeks` weeks, with their share of the window's activity."""
+        cutoff = int(datetime.now(timezone.utc).timestamp()) - weeks * WEEK_SECONDS
+        with self._lock:
+            recent = Counter(r for r, timestamp in zip(self.repo_column, self.timestamp_column) if timestamp >= cutoff)
+            overall = Counter(self.repo_column)
+            repos = list(self.repos)
+
+        return [
+            {
+                "repo": repos[repo],
+                "recent_commits": count,
+                "window_commits": overall[repo],
+                "recent_share": round(count / overall[repo], 2),
+            }
+            for repo, count in recent.most_common(top)
+        ]
+
+    def summary(self, members: Iterable[str] = None) -> dict:
+        return {
+            "hot_spots": self.hot_spots(),
+            "bus_factor": self.bus_factor(),
+            "weekly_by_member": self.weekly_by_member(members),
+            "weekly_by_repo": self.weekly_by_repo(),
+        }
@@ -0,0 +1,30 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, Tuple, Any
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def iter_concurrently(func: Callable, items: Iterable, max_workers: int = DEFAULT_MAX_WORKERS) -> Iterator[Tuple[Any, Any, Exception]]:
+    """
+    Runs func over items on a thread pool, yielding (item, result, error) as each call completes. Each
+    call runs in a copy of the caller's context, so a RequestCounter active in the caller sees its requests.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(contextvars.copy_context().run, func, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+
+
+def run_concurrently(func: Callable, items: Iterable, max_workers: int = DEFAULT_MAX_WORKERS) -> dict:
+    """Runs func over items on a thread pool and returns {item: result}, raising the first error."""
+    results = {}
+    for item, result, error in iter_concurrently(func, items, max_workers):
+        if error is not None:
+            raise error
+        results[item] = result
+    return results
@@ -0,0 +1,36 @@
+from typing import Any, Dict
+
+from models.snapshot_diff import SnapshotDiff
+
+
+def row_key(index: int, item, key_field: str = None):
+    if key_field and isinstance(item, dict) and key_field in item:
+        return item[key_field]
+    return index
+
+
+def _rows(data, key_field: str = None) -> Dict[Any, Any]:
+    if isinstance(data, dict):
+        return dict(data)
+    return {row_key(index, item, key_field): item for index, item in enumerate(data)}
+
+
+def diff_listings(old, new, key_field: str = None) -> SnapshotDiff:
+    """
+    Diffs two listings row by row. Lists are keyed by key_field (falling back to position) and
+    dicts by their keys; anything else is reported as a full replacement.
+    """
+    if old is None or not isinstance(new, (list, dict)) or isinstance(old, dict) != isinstance(new, dict):
+        return SnapshotDiff(replaced=old != new)
+
+    old_rows = _rows(old, key_field)
+    new_rows = _rows(new, key_field)
+    if len(old_rows) != len(old) or len(new_rows) != len(new):
+        # Duplicate keys cannot be patched row by row.
+        return SnapshotDiff(replaced=old != new)
+
+    return SnapshotDiff(
+        added={k: v for k, v in new_rows.items() if k not in old_rows},
+        removed=[k for k in old_rows if k not in new_rows],
+        changed={k: v for k, v in new_rows.items() if k in old_rows and old_rows[k] != v},
+    )
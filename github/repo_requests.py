@@ -7,7 +7,7 @@ class GitHubRepoRequests:
         self.organisation = organisation
 
     def get_repo(self):
-        return self.client.get(f"/repos/{self.client}/{self.repo}")
+        return self.client.get(f"/repos/{self.organisation}/{self.repo}")
 
     def list_pull_requests(self, state: str = "open"):
         return self.client.get(
@@ -29,9 +29,11 @@ class GitHubRepoRequests:
             f"/repos/{self.organisation}/{self.repo}/issues/{issue_number}"
         )
 
-    def list_commits(self):
+    def list_commits(self, since: str = None, until: str = None, author: str = None, path: str = None):
+        params = {"since": since, "until": until, "author": author, "path": path, "per_page": 100}
         return self.client.get(
-            f"/repos/{self.organisation}/{self.repo}/commits"
+            f"/repos/{self.organisation}/{self.repo}/commits",
+            params={k: v for k, v in params.items() if v is not None}
         )
 
     def get_commit(self, sha: str):
@@ -41,7 +43,7 @@ class GitHubRepoRequests:
 
     def list_branches(self):
         return self.client.get(
-            f"/repos/{self.organisation}/{self.repo}/branches"
+            f"/repos/{self.organisation}/{self.repo}/branches", params={"per_page": 100}
         )
 
     def get_branch(self, branch: str):
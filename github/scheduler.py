@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+from config import Logger
+from models.snapshot_diff import SnapshotDiff
+from .client import RateLimit, RequestCounter
+
+RATE_LIMIT_WINDOW = 3600.0
+
+
+@dataclass
+class _ScheduledQuery:
+    name: str
+    refresh: Callable[[], SnapshotDiff]
+    min_interval: float
+    max_interval: float
+    interval: float
+    next_run: float
+    cost: int = 1
+
+
+class RefreshScheduler:
+    """
+    Refreshes registered queries on a background thread. A query's interval halves each time its
+    refresh returns a non-empty diff and grows by half each time nothing changed, so busy listings
+    are polled often and quiet ones rarely. Refreshes are deferred while the requests spent in the
+    last hour would exceed budget_share of the rate limit.
+    """
+
+    BACKOFF = 1.5
+
+    def __init__(self, budget_share: float = 0.2):
+        self.budget_share = budget_share
+        self._queries: Dict[str, _ScheduledQuery] = {}
+        self._spent = deque()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def register(self, name: str, refresh: Callable[[], SnapshotDiff], min_interval: float = 60, max_interval: float = 1800):
+        with self._lock:
+            self._queries[name] = _ScheduledQuery(
+                name=name,
+                refresh=refresh,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                interval=min_interval,
+                next_run=time.monotonic() + min_interval,
+            )
+
+    def unregister(self, name: str):
+        with self._lock:
+            self._queries.pop(name, None)
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def budget(self) -> int:
+        return int(RateLimit.limit * self.budget_share)
+
+    def spent(self) -> int:
+        cutoff = time.monotonic() - RATE_LIMIT_WINDOW
+        while self._spent and self._spent[0][0] < cutoff:
+            self._spent.popleft()
+        return sum(cost for _, cost in self._spent)
+
+    def budget_frees_at(self, cost: int) -> float:
+        """Monotonic time at which enough of the last hour's spend has aged out to afford `cost` more requests."""
+        excess = self.spent() + cost - self.budget()
+        for spent_at, spent_cost in self._spent:
+            excess -= spent_cost
+            if excess <= 0:
+                return spent_at + RATE_LIMIT_WINDOW
+        # Costs more than the whole budget, so wait until everything spent so far has aged out.
+        return self._spent[-1][0] + RATE_LIMIT_WINDOW if self._spent else time.monotonic()
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                now = time.monotonic()
+                due = sorted((q for q in self._queries.values() if q.next_run <= now), key=lambda q: q.next_run)
+
+            for query in due:
+                if self._stop.is_set():
+                    return
+                # A query costing more than the whole budget still runs once nothing else has been spent.
+                if self.spent() and self.spent() + query.cost > self.budget():
+                    query.next_run = self.budget_frees_at(query.cost)
+                    Logger.log(f"Refresh of {query.name} deferred, rate-limit budget spent")
+                    continue
+                self._refresh(query)
+
+            with self._lock:
+                next_run = min((q.next_run for q in self._queries.values()), default=time.monotonic() + 60)
+            self._stop.wait(max(1.0, next_run - time.monotonic()))
+
+    def _refresh(self, query: _ScheduledQuery):
+        with RequestCounter() as counter:
+            try:
+                changed = not query.refresh().empty
+            except Exception as e:
+                Logger.log(f"Refresh of {query.name} failed: {e}")
+                changed = False
+
+        query.cost = max(1, counter.count)
+        self._spent.append((time.monotonic(), query.cost))
+
+        if changed:
+            query.interval = max(query.min_interval, query.interval / 2)
+        else:
+            query.interval = min(query.max_interval, query.interval * self.BACKOFF)
+        query.next_run = time.monotonic() + query.interval
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import mmap
+import threading
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Union
+
+from models.snapshot_diff import SnapshotDiff
+from .diffing import row_key
+
+
+def _canonical(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class Snapshot:
+    """
+    A stored listing. Row keys and content hashes come from the manifest; the rows themselves
+    are only decompressed from the memory-mapped pack when asked for.
+    """
+
+    def __init__(self, store: "SnapshotStore", name: str, snapshot_id: str, manifest: dict):
+        self.store = store
+        self.name = name
+        self.snapshot_id = snapshot_id
+        self.kind = manifest["kind"]
+        self.label_key = manifest.get("label_key")
+        self.rows = manifest["rows"]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def keys(self) -> list:
+        return [key for key, _ in self.rows]
+
+    def row(self, index: int):
+        return self.store.read_row(self.rows[index][1])
+
+    def hashes(self) -> Dict[object, str]:
+        return {key: digest for key, digest in self.rows}
+
+    def materialize(self):
+        if self.kind == "dict":
+            return {key: self.store.read_row(digest) for key, digest in self.rows}
+        if self.kind == "list":
+            return [self.store.read_row(digest) for _, digest in self.rows]
+        return self.store.read_row(self.rows[0][1]) if self.rows else None
+
+
+class SnapshotStore:
+    """
+    Content-addressed history of fetched listings. Every row is stored once as zlib-compressed JSON in
+    an append-only pack keyed by its SHA-1, so snapshots share rows that did not change; a snapshot is
+    just a manifest of (row key, hash) pairs. Rows holding a list, such as a repo's pull requests, get
+    a list of hashes, one per element. The pack is memory-mapped for reading. Only the newest
+    MAX_SNAPSHOTS manifests of each listing are kept.
+    """
+
+    DEFAULT_PATH = Path(".cache/snapshots")
+    MAX_SNAPSHOTS = 50
+
+    def __init__(self, path: Union[str, Path] = None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.pack_path = self.path / "objects.pack"
+        self.index_path = self.path / "objects.idx"
+        self.manifest_path = self.path / "manifests"
+        self._lock = threading.Lock()
+        self._index: Dict[str, tuple] = {}
+        self._map = None
+        self._load_index()
+
+    def _load_index(self):
+        if not self.index_path.exists():
+            return
+
+        pack_size = self.pack_path.stat().st_size if self.pack_path.exists() else 0
+        with self.index_path.open("r", encoding="ascii", errors="replace") as f:
+            for line in f:
+                # An interrupted save can leave a torn line, or entries for objects that never reached the pack.
+                parts = line.split()
+                if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
+                    continue
+                offset, length = int(parts[1]), int(parts[2])
+                if offset + length <= pack_size:
+                    self._index[parts[0]] = (offset, length)
+
+    def _write_object(self, data: bytes, pack, index) -> str:
+        digest = hashlib.sha1(data).hexdigest()
+        if digest not in self._index:
+            compressed = zlib.compress(data)
+            offset = pack.tell()
+            pack.write(compressed)
+            index.write(f"{digest} {offset} {len(compressed)}\n")
+            self._index[digest] = (offset, len(compressed))
+        return digest
+
+    def _write_row(self, item, pack, index):
+        if isinstance(item, list):
+            return [self._write_object(_canonical(element), pack, index) for element in item]
+        return self._write_object(_canonical(item), pack, index)
+
+    def read_row(self, digest):
+        if isinstance(digest, list):
+            return [self.read(d) for d in digest]
+        return self.read(digest)
+
+    def read(self, digest: str):
+        with self._lock:
+            offset, length = self._index[digest]
+            if self._map is None or offset + length > len(self._map):
+                if self._map is not None:
+                    self._map.close()
+                with self.pack_path.open("rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            compressed = self._map[offset:offset + length]
+        return json.loads(zlib.decompress(compressed))
+
+    def save(self, name: str, data, label_key: str = None) -> str:
+        """Stores a listing and returns its snapshot id, or the latest id if nothing changed since."""
+        if isinstance(data, dict):
+            kind, items = "dict", list(data.items())
+        elif isinstance(data, list):
+            kind, items = "list", [(row_key(i, item, label_key), item) for i, item in enumerate(data)]
+        else:
+            kind, items = "value", [(0, data)]
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            with self.pack_path.open("ab") as pack, self.index_path.open("a", encoding="ascii") as index:
+                pack.seek(0, 2)
+                rows = [
+                    [key, self._write_row(item, pack, index)]
+                    for key, item in items
+                ]
+
+            latest = self.latest(name)
+            if latest is not None and latest.kind == kind and latest.label_key == label_key and latest.rows == rows:
+                return latest.snapshot_id
+
+            snapshot_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+            directory = self.manifest_path / name
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp = directory / f"{snapshot_id}.tmp"
+            tmp.write_text(json.dumps({"kind": kind, "label_key": label_key, "rows": rows}), encoding="utf-8")
+            tmp.replace(directory / f"{snapshot_id}.json")
+
+            for old_id in self.snapshot_ids(name)[:-self.MAX_SNAPSHOTS]:
+                (directory / f"{old_id}.json").unlink(missing_ok=True)
+            return snapshot_id
+
+    def names(self) -> List[str]:
+        if not self.manifest_path.exists():
+            return []
+        return sorted(p.name for p in self.manifest_path.iterdir() if p.is_dir())
+
+    def snapshot_ids(self, name: str) -> List[str]:
+        directory = self.manifest_path / name
+        if not directory.exists():
+            return []
+        return sorted(p.stem for p in directory.glob("*.json"))
+
+    def open(self, name: str, snapshot_id: str) -> Snapshot:
+        manifest = json.loads((self.manifest_path / name / f"{snapshot_id}.json").read_text(encoding="utf-8"))
+        return Snapshot(self, name, snapshot_id, manifest)
+
+    def latest(self, name: str):
+        ids = self.snapshot_ids(name)
+        return self.open(name, ids[-1]) if ids else None
+
+    def diff(self, name: str, old_id: str, new_id: str) -> SnapshotDiff:
+        """Diffs two snapshots by row hash, decompressing only the rows that were added or changed."""
+        old = self.open(name, old_id)
+        new = self.open(name, new_id)
+        if old.kind != new.kind or old.kind == "value":
+            return SnapshotDiff(replaced=old.rows != new.rows)
+
+        old_hashes = old.hashes()
+        new_hashes = new.hashes()
+        if len(old_hashes) != len(old) or len(new_hashes) != len(new):
+            # Duplicate keys cannot be matched row by row.
+            return SnapshotDiff(replaced=old.rows != new.rows)
+
+        return SnapshotDiff(
+            added={k: self.read_row(h) for k, h in new_hashes.items() if k not in old_hashes},
+            removed=[k for k in old_hashes if k not in new_hashes],
+            changed={k: self.read_row(h) for k, h in new_hashes.items() if k in old_hashes and old_hashes[k] != h},
+        )
@@ -0,0 +1,152 @@
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from models.snapshot_diff import SnapshotDiff
+from .diffing import diff_listings
+
+MEMBERS = "members"
+REPOS = "repos"
+PULL_REQUESTS = "pull_requests"
+
+# Field identifying a row in each listing; pull requests are keyed by repository name.
+ROW_KEYS = {
+    MEMBERS: "login",
+    REPOS: "name",
+    PULL_REQUESTS: None,
+}
+
+
+def _upsert(items: list, key: str, item: dict):
+    for index, existing in enumerate(items):
+        if isinstance(existing, dict) and existing.get(key) == item.get(key):
+            items[index] = {**existing, **item}
+            return
+    items.append(item)
+
+
+def _remove(items: list, key: str, value) -> bool:
+    for index, existing in enumerate(items):
+        if isinstance(existing, dict) and existing.get(key) == value:
+            del items[index]
+            return True
+    return False
+
+
+class TeamDataCache:
+    """
+    In-memory copy of the configured team's members, repositories and open pull requests.
+    Listeners are called with (key, SnapshotDiff) whenever a listing changes; patches replace the
+    stored listing rather than mutating it, so readers can hold on to what get() returned.
+    """
+
+    def __init__(self, team_slug: str):
+        self.team_slug = team_slug
+        self._lock = threading.Lock()
+        self._data: Dict[str, object] = {}
+        self._listeners: List[Callable[[str, SnapshotDiff], None]] = []
+
+    def subscribe(self, listener: Callable[[str, SnapshotDiff], None]):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, SnapshotDiff], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, key: str, old, new) -> SnapshotDiff:
+        diff = diff_listings(old, new, ROW_KEYS.get(key))
+        if not diff.empty:
+            for listener in list(self._listeners):
+                listener(key, diff)
+        return diff
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value) -> SnapshotDiff:
+        with self._lock:
+            old = self._data.get(key)
+            self._data[key] = value
+        return self._notify(key, old, value)
+
+    def apply_event(self, event: str, payload: dict):
+        handler = getattr(self, f"_apply_{event}", None)
+        if handler is None:
+            return
+
+        with self._lock:
+            before = dict(self._data)
+            changed = handler(payload)
+            after = self._data.get(changed)
+        if changed:
+            self._notify(changed, before.get(changed), after)
+
+    def _apply_membership(self, payload: dict):
+        if payload.get("scope") != "team" or (payload.get("team") or {}).get("slug") != self.team_slug:
+            return None
+
+        members = self._data.get(MEMBERS)
+        member = payload.get("member") or {}
+        if members is None or not member:
+            return None
+
+        members = list(members)
+        if payload.get("action") == "added":
+            _upsert(members, "login", member)
+        elif payload.get("action") == "removed":
+            _remove(members, "login", member.get("login"))
+        else:
+            return None
+        self._data[MEMBERS] = members
+        return MEMBERS
+
+    def _apply_pull_request(self, payload: dict):
+        pull_requests = self._data.get(PULL_REQUESTS)
+        repo = (payload.get("repository") or {}).get("name")
+        pr = payload.get("pull_request") or {}
+        if pull_requests is None or repo not in pull_requests or not pr:
+            return None
+
+        repo_prs = list(pull_requests[repo])
+        if pr.get("state") == "open":
+            _upsert(repo_prs, "number", pr)
+        elif not _remove(repo_prs, "number", pr.get("number")):
+            return None
+        self._data[PULL_REQUESTS] = {**pull_requests, repo: repo_prs}
+        return PULL_REQUESTS
+
+    def _apply_pull_request_review(self, payload: dict):
+        pull_requests = self._data.get(PULL_REQUESTS)
+        repo = (payload.get("repository") or {}).get("name")
+        pr = payload.get("pull_request") or {}
+        review = payload.get("review") or {}
+        if pull_requests is None or repo not in pull_requests or pr.get("state") != "open":
+            return None
+
+        repo_prs = list(pull_requests[repo])
+        _upsert(repo_prs, "number", {
+            **pr,
+            "latest_review": {
+                "user": (review.get("user") or {}).get("login"),
+                "state": review.get("state"),
+                "submitted_at": review.get("submitted_at"),
+            },
+        })
+        self._data[PULL_REQUESTS] = {**pull_requests, repo: repo_prs}
+        return PULL_REQUESTS
+
+    def _apply_push(self, payload: dict):
+        repos = self._data.get(REPOS)
+        repository = payload.get("repository") or {}
+        if repos is None or not any(isinstance(r, dict) and r.get("name") == repository.get("name") for r in repos):
+            return None
+
+        pushed_at = repository.get("pushed_at")
+        if isinstance(pushed_at, int):
+            pushed_at = datetime.fromtimestamp(pushed_at, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        repos = list(repos)
+        _upsert(repos, "name", {"name": repository.get("name"), "pushed_at": pushed_at})
+        self._data[REPOS] = repos
+        return REPOS
@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Union
+
+from .concurrency import run_concurrently, DEFAULT_MAX_WORKERS
+from .team_requests import GitHubTeamRequests
+
+PERMISSION_ORDER = ["read", "triage", "write", "maintain", "admin"]
+
+
+def _repo_permission(repo: dict) -> str:
+    role = repo.get("role_name")
+    if role:
+        return role
+
+    permissions = repo.get("permissions") or {}
+    for permission, flag in (("admin", "admin"), ("maintain", "maintain"), ("push", "write"), ("triage", "triage")):
+        if permissions.get(permission):
+            return flag
+    return "read"
+
+
+def _team_fingerprint(team: dict) -> dict:
+    return {
+        "id": team.get("id"),
+        "name": team.get("name"),
+        "parent": (team.get("parent") or {}).get("slug"),
+    }
+
+
+class TeamGraph:
+    """
+    Team <-> member <-> repository graph for a whole organisation, persisted locally with indexes in
+    both directions. Refreshing only re-reads the members and repositories of teams whose listings changed.
+    """
+
+    DEFAULT_PATH = Path(".cache/team_graph.json")
+    MAX_AGE = 24 * 3600
+
+    def __init__(self, organisation: str, path: Union[str, Path] = None, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.organisation = organisation
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.max_workers = max_workers
+        self.refreshed_at = None
+        self._lock = threading.Lock()
+        self._teams: Dict[str, dict] = {}
+        self._member_index: Dict[str, set] = {}
+        self._repo_index: Dict[str, Dict[str, str]] = {}
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+
+        with self.path.open("r", encoding="utf-8") as f:
+            data = json.load(f) or {}
+
+        if data.get("organisation") != self.organisation:
+            return
+
+        with self._lock:
+            self._teams = data.get("teams", {})
+            self.refreshed_at = data.get("refreshed_at")
+            self._reindex()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"organisation": self.organisation, "refreshed_at": self.refreshed_at, "teams": self._teams}
+            text = json.dumps(data)
+
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(self.path)
+
+    def refresh(self):
+        """Rebuilds the graph concurrently, skipping teams whose member and repo listings are unchanged."""
+        listing = GitHubTeamRequests(self.organisation, "").list_teams().value() or []
+        teams = {team["slug"]: team for team in listing if isinstance(team, dict)}
+
+        with self._lock:
+            previous = dict(self._teams)
+
+        results = run_concurrently(
+            lambda slug: self._fetch_team(teams[slug], previous.get(slug)),
+            list(teams),
+            self.max_workers,
+        )
+
+        with self._lock:
+            self._teams = results
+            self.refreshed_at = time.time()
+            self._reindex()
+
+        self.save()
+        return self
+
+    def is_stale(self, max_age: float = None) -> bool:
+        max_age = self.MAX_AGE if max_age is None else max_age
+        return self.refreshed_at is None or time.time() - self.refreshed_at > max_age
+
+    def refresh_if_stale(self, max_age: float = None):
+        """Answers from the persisted graph, only rebuilding it when it was never built or is older than max_age."""
+        if self.is_stale(max_age):
+            self.refresh()
+        return self
+
+    def _fetch_team(self, team: dict, cached: dict = None) -> dict:
+        cached = cached or {}
+        # Each worker gets its own client; a requests Session is not guaranteed to be thread-safe.
+        gtr = GitHubTeamRequests(self.organisation, team["slug"])
+
+        members, members_etag = gtr.get_team_members_if_changed(cached.get("members_etag"))
+        repos, repos_etag = gtr.get_team_repos_if_changed(cached.get("repos_etag"))
+
+        return {
+            "team": _team_fingerprint(team),
+            "members_etag": members_etag,
+            "repos_etag": repos_etag,
+            "members": cached.get("members", []) if members is None else members.pluck("login").value(),
+            "repos": cached.get("repos", {}) if repos is None else {
+                repo["name"]: _repo_permission(repo) for repo in repos.value() if isinstance(repo, dict)
+            },
+        }
+
+    def apply_event(self, event: str, payload: dict):
+        """Applies a webhook membership event to the graph without refetching the team."""
+        if event != "membership" or payload.get("scope") != "team":
+            return
+
+        slug = (payload.get("team") or {}).get("slug")
+        login = (payload.get("member") or {}).get("login")
+        with self._lock:
+            team = self._teams.get(slug)
+            if team is None or not login:
+                return
+
+            members = [m for m in team.get("members", []) if m.lower() != login.lower()]
+            if payload.get("action") == "added":
+                members.append(login)
+            team["members"] = members
+            self._reindex()
+
+        self.save()
+
+    def _reindex(self):
+        self._member_index = {}
+        self._repo_index = {}
+        for slug, team in self._teams.items():
+            for login in team.get("members", []):
+                self._member_index.setdefault(login.lower(), set()).add(slug)
+            for repo, permission in team.get("repos", {}).items():
+                self._repo_index.setdefault(repo.lower(), {})[slug] = permission
+
+    def teams(self) -> List[str]:
+        with self._lock:
+            return sorted(self._teams)
+
+    def members_of(self, team_slug: str) -> List[str]:
+        with self._lock:
+            return sorted(self._teams.get(team_slug, {}).get("members", []))
+
+    def repos_of(self, team_slug: str) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._teams.get(team_slug, {}).get("repos", {}))
+
+    def teams_for_member(self, login: str) -> List[dict]:
+        with self._lock:
+            return [
+                {"team": slug, "name": self._teams[slug]["team"].get("name")}
+                for slug in sorted(self._member_index.get(login.lower(), ()))
+            ]
+
+    def teams_for_repo(self, repo: str) -> List[dict]:
+        with self._lock:
+            access = self._repo_index.get(repo.lower(), {})
+        return sorted(
+            ({"team": slug, "permission": permission} for slug, permission in access.items()),
+            key=lambda t: (-PERMISSION_ORDER.index(t["permission"]) if t["permission"] in PERMISSION_ORDER else 1, t["team"]),
+        )
+
+    def repo_owners(self, repo: str) -> List[dict]:
+        """Teams holding the highest permission level granted on the repository."""
+        access = self.teams_for_repo(repo)
+        if not access:
+            return []
+        top = access[0]["permission"]
+        return [t for t in access if t["permission"] == top]
+
+    def shared_members(self, min_teams: int = 2) -> Dict[str, List[str]]:
+        with self._lock:
+            return {
+                login: sorted(slugs)
+                for login, slugs in sorted(self._member_index.items())
+                if len(slugs) >= min_teams
+            }
@@ -0,0 +1,49 @@
+from models.github_config import GithubConfig
+from models.snapshot_diff import SnapshotDiff
+from .concurrency import run_concurrently, DEFAULT_MAX_WORKERS
+from .repo_requests import GitHubRepoRequests
+from .team_cache import TeamDataCache, MEMBERS, REPOS, PULL_REQUESTS
+from .team_requests import GitHubTeamRequests
+
+
+class TeamQueries:
+    """Fetches the configured team's listings into a TeamDataCache, returning what changed."""
+
+    def __init__(self, config: GithubConfig, cache: TeamDataCache, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.config = config
+        self.cache = cache
+        self.max_workers = max_workers
+        self.gtr = GitHubTeamRequests(config.organisation, config.team)
+
+    def active_repos(self):
+        repos = self.cache.get(REPOS)
+        if repos is None:
+            self.refresh_repos()
+            repos = self.cache.get(REPOS)
+
+        return [
+            repo for repo in repos
+            if not repo.get("archived") and repo["name"] not in self.config.ignored_repositories
+        ]
+
+    def active_repo_names(self):
+        return [repo["name"] for repo in self.active_repos()]
+
+    def refresh_members(self) -> SnapshotDiff:
+        return self.cache.set(MEMBERS, self.gtr.get_team_members().data)
+
+    def refresh_repos(self) -> SnapshotDiff:
+        return self.cache.set(REPOS, self.gtr.get_team_repos().data)
+
+    def refresh_pull_requests(self) -> SnapshotDiff:
+        results = run_concurrently(
+            lambda name: GitHubRepoRequests(self.config.organisation, name).list_pull_requests().data,
+            self.active_repo_names(),
+            self.max_workers,
+        )
+        return self.cache.set(PULL_REQUESTS, {name: results[name] for name in sorted(results)})
+
+    def register(self, scheduler):
+        scheduler.register(MEMBERS, self.refresh_members, min_interval=300, max_interval=3600)
+        scheduler.register(REPOS, self.refresh_repos, min_interval=300, max_interval=3600)
+        scheduler.register(PULL_REQUESTS, self.refresh_pull_requests, min_interval=60, max_interval=900)
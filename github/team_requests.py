@@ -1,13 +1,13 @@
 from .client import GitHubClient
 
 class GitHubTeamRequests:
-    def __init__(self, organisation: str, team_slug: str):
-        self.client = GitHubClient()
+    def __init__(self, organisation: str, team_slug: str, client: GitHubClient = None):
+        self.client = client or GitHubClient()
         self.organisation = organisation
         self.team_slug = team_slug
 
     def list_teams(self):
-        return self.client.get(f"/orgs/{self.organisation}/teams")
+        return self.client.get(f"/orgs/{self.organisation}/teams", params={"per_page": 100})
 
     def get_team_members(self):
         return self.client.get(f"/orgs/{self.organisation}/teams/{self.team_slug}/members")
@@ -15,6 +15,16 @@ class GitHubTeamRequests:
     def get_team_repos(self):
         return self.client.get(f"/orgs/{self.organisation}/teams/{self.team_slug}/repos")
 
+    def get_team_members_if_changed(self, etag: str = None):
+        return self.client.get_if_changed(
+            f"/orgs/{self.organisation}/teams/{self.team_slug}/members", etag, params={"per_page": 100}
+        )
+
+    def get_team_repos_if_changed(self, etag: str = None):
+        return self.client.get_if_changed(
+            f"/orgs/{self.organisation}/teams/{self.team_slug}/repos", etag, params={"per_page": 100}
+        )
+
     def add_team_member(self, username: str, role="member"):
         data = {"role": role}
         return self.client.put(f"/orgs/{self.organisation}/teams/{self.team_slug}/memberships/{username}", data)
@@ -0,0 +1,111 @@
+import hashlib
+import hmac
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+from config import Logger
+
+SUPPORTED_EVENTS = ("pull_request", "pull_request_review", "push", "membership")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature)
+
+
+class WebhookReceiver:
+    """
+    Optional local HTTP listener for GitHub webhook deliveries (usually via a forwarder such as
+    `gh webhook forward`). Verified payloads are handed to every subscriber as (event, payload).
+    """
+
+    def __init__(self, secret: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self._subscribers: List[Callable[[str, dict], None]] = []
+        self._server = None
+        self._thread = None
+
+    @classmethod
+    def from_environment(cls):
+        """Builds a receiver from GITHUB_WEBHOOK_SECRET / GITHUB_WEBHOOK_PORT, or None when no secret is set."""
+        secret = os.getenv("GITHUB_WEBHOOK_SECRET")
+        if not secret:
+            return None
+        return cls(secret, port=int(os.getenv("GITHUB_WEBHOOK_PORT", DEFAULT_PORT)))
+
+    def subscribe(self, callback: Callable[[str, dict], None]):
+        self._subscribers.append(callback)
+
+    def dispatch(self, event: str, payload: dict):
+        for callback in list(self._subscribers):
+            try:
+                callback(event, payload)
+            except Exception as e:
+                Logger.log(f"Webhook subscriber failed for {event}: {e}")
+
+    def start(self):
+        if self._server is not None:
+            return
+
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        Logger.log(f"Webhook receiver listening on {self.host}:{self.port}")
+
+    def stop(self):
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    def _handler(self):
+        receiver = self
+
+        class _WebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                body = self.rfile.read(length)
+
+                if not verify_signature(receiver.secret, body, self.headers.get("X-Hub-Signature-256")):
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                event = self.headers.get("X-GitHub-Event", "")
+                self.send_response(202 if event in SUPPORTED_EVENTS else 204)
+                self.end_headers()
+
+                if event in SUPPORTED_EVENTS:
+                    receiver.dispatch(event, payload)
+
+            def log_message(self, format, *args):
+                Logger.log("Webhook", format % args)
+
+        return _WebhookHandler
@@ -9,6 +9,9 @@ from textual.widgets import (
     Tree,
 )
 
+from github.diffing import row_key
+from models.snapshot_diff import SnapshotDiff
+
 
 def _format_primitive(value) -> Text:
     if isinstance(value, str):
@@ -52,27 +55,64 @@ class JsonTreeViewer(Container):
         self._build_tree(root, self._original_data)
         root.expand()
 
+    def set_data(self, data):
+        """Replaces the viewed data, keeping the current search filter applied."""
+        self._original_data = data
+        query = self.query_one("#json_search", Input).value.lower().strip()
+        tree = self.query_one("#json_tree", Tree)
+        tree.root.remove_children()
+
+        if not query:
+            self._build_tree(tree.root, self._original_data)
+        else:
+            self._build_tree(tree.root, self._filter_json(self._original_data, query))
+            tree.root.expand_all()
+
+    def apply_diff(self, data, diff: SnapshotDiff):
+        """Patches only the top-level rows named in the diff instead of rebuilding the whole tree."""
+        search = self.query_one("#json_search", Input).value.strip()
+        if diff.replaced or search or not isinstance(data, (dict, list)):
+            self.set_data(data)
+            return
+
+        self._original_data = data
+        tree = self.query_one("#json_tree", Tree)
+        nodes = {child.data: child for child in tree.root.children}
+
+        for key in diff.removed:
+            if key in nodes:
+                nodes.pop(key).remove()
+
+        for key, value in diff.changed.items():
+            node = nodes.get(key)
+            if node is None:
+                self._add_row(tree.root, key, value, isinstance(data, dict))
+                continue
+            node.remove_children()
+            self._build_value(node, value)
+
+        for key, value in diff.added.items():
+            self._add_row(tree.root, key, value, isinstance(data, dict))
+
+    def _add_row(self, node, key, value, keyed: bool):
+        if keyed:
+            label = Text(str(key), style="bold cyan")
+        elif isinstance(key, int) and not (isinstance(value, dict) and self._label_key in value):
+            label = Text(f"[{key}]", style="bold magenta")
+        else:
+            label = Text(str(key), style="bold magenta")
+
+        child = node.add(label, data=key)
+        self._build_value(child, value)
+
     def _build_tree(self, node, data):
         if isinstance(data, dict):
             for key, value in data.items():
-                label = Text(str(key), style="bold cyan")
-                child = node.add(label)
-                self._build_value(child, value)
+                self._add_row(node, key, value, keyed=True)
 
         elif isinstance(data, list):
             for index, item in enumerate(data):
-                if (
-                        isinstance(item, dict)
-                        and self._label_key
-                        and self._label_key in item
-                ):
-                    label_text = str(item[self._label_key])
-                    label = Text(label_text, style="bold magenta")
-                else:
-                    label = Text(f"[{index}]", style="bold magenta")
-
-                child = node.add(label)
-                self._build_value(child, item)
+                self._add_row(node, row_key(index, item, self._label_key), item, keyed=False)
 
         else:
             node.set_label(_format_primitive(data))
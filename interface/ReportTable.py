@@ -0,0 +1,45 @@
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.widgets import DataTable, Label
+
+
+def _sort_key(value):
+    # None sorts first; numbers and strings are kept apart so mixed columns still sort.
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value).lower())
+
+
+class ReportTable(Container):
+    """Table of report rows; selecting a column header sorts by it, selecting it again reverses the order."""
+
+    def __init__(self, rows, title="Report", columns=None):
+        super().__init__()
+        self._rows = rows
+        self._title = title
+        self._columns = columns or (list(rows[0]) if rows else [])
+        self._sorted_by = None
+        self._reverse = False
+
+    def compose(self) -> ComposeResult:
+        yield Label(self._title, classes="section")
+        yield DataTable(id="report_table", zebra_stripes=True)
+
+    def on_mount(self):
+        table = self.query_one("#report_table", DataTable)
+        for column in self._columns:
+            table.add_column(column.replace("_", " ").title(), key=column)
+        for row in self._rows:
+            table.add_row(*("" if row.get(c) is None else row.get(c) for c in self._columns))
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected):
+        column = event.column_key.value
+        self._reverse = not self._reverse if self._sorted_by == column else False
+        self._sorted_by = column
+
+        table = self.query_one("#report_table", DataTable)
+        table.clear()
+        for row in sorted(self._rows, key=lambda r: _sort_key(r.get(column)), reverse=self._reverse):
+            table.add_row(*("" if row.get(c) is None else row.get(c) for c in self._columns))
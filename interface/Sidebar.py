@@ -9,3 +9,4 @@ class Sidebar(Container):
         yield Button("Home", id="home")
         yield Button("Settings", id="settings")
         yield Button("Github", id="github")
+        yield Button("Snapshots", id="snapshots")
@@ -0,0 +1,45 @@
+from rich.text import Text
+from textual.events import Mount
+from textual.widgets import Input, Tree
+
+from github.snapshots import Snapshot
+from .JsonTreeViewer import JsonTreeViewer
+
+
+class SnapshotViewer(JsonTreeViewer):
+    """JsonTreeViewer over a stored snapshot; each row is only read from the store when its node is expanded."""
+
+    def __init__(self, snapshot: Snapshot, title=None):
+        super().__init__(None, title=title or f"{snapshot.name} @ {snapshot.snapshot_id}", label_key=snapshot.label_key)
+        self._snapshot = snapshot
+        self._unloaded = {}
+
+    def on_mount(self, event: Mount):
+        # JsonTreeViewer.on_mount would build the whole tree from data this viewer has not loaded.
+        event.prevent_default()
+        tree = self.query_one("#json_tree", Tree)
+        tree.show_root = False
+
+        for index, key in enumerate(self._snapshot.keys()):
+            if self._snapshot.kind == "dict":
+                label = Text(str(key), style="bold cyan")
+            elif isinstance(key, int):
+                label = Text(f"[{key}]", style="bold magenta")
+            else:
+                label = Text(str(key), style="bold magenta")
+            node = tree.root.add(label, data=key)
+            self._unloaded[node.id] = index
+
+        tree.root.expand()
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded):
+        index = self._unloaded.pop(event.node.id, None)
+        if index is not None:
+            self._build_value(event.node, self._snapshot.row(index))
+
+    def on_input_changed(self, event: Input.Changed):
+        # Searching needs every row, so the snapshot is only fully read once a search starts.
+        # JsonTreeViewer.on_input_changed then runs as the next handler in the MRO and rebuilds the tree.
+        if event.input.id == "json_search" and self._original_data is None:
+            self._original_data = self._snapshot.materialize()
+            self._unloaded.clear()
@@ -1,2 +1,4 @@
 from .JsonTreeViewer import JsonTreeViewer
 from .Sidebar import Sidebar
+from .ReportTable import ReportTable
+from .SnapshotViewer import SnapshotViewer
@@ -3,11 +3,13 @@ from textual.containers import Container
 from textual.widgets import Header, Footer, Button
 
 from Sidebar import Sidebar
-from config import YAMLConfig
-from github import GitHubTeamRequests
+from config import YAMLConfig, Logger
+from github import GitHubTeamRequests, TeamDataCache, TeamGraph, TeamQueries, RefreshScheduler, WebhookReceiver, SnapshotStore
+from github.team_cache import ROW_KEYS
 from views.git_view import GithubView
 from views.home_view import HomeView
 from views.settings_view import SettingsView
+from views.snapshot_view import SnapshotView
 
 
 class MyApp(App):
@@ -21,6 +23,18 @@ class MyApp(App):
             config.config.github.organisation,
             config.config.github.team,
         )
+        self.team_cache = TeamDataCache(config.config.github.team)
+        self.team_graph = TeamGraph(config.config.github.organisation)
+        self.snapshots = SnapshotStore()
+        self.team_cache.subscribe(
+            lambda key, diff: self.snapshots.save(key, self.team_cache.get(key), ROW_KEYS.get(key))
+        )
+        self.scheduler = RefreshScheduler(config.config.github.refresh_budget_share)
+        TeamQueries(config.config.github, self.team_cache).register(self.scheduler)
+        self.webhooks = WebhookReceiver.from_environment()
+        if self.webhooks:
+            self.webhooks.subscribe(self.team_cache.apply_event)
+            self.webhooks.subscribe(self.team_graph.apply_event)
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -35,9 +49,24 @@ class MyApp(App):
     async def on_mount(self) -> None:
         content = self.query_one("#content", Container)
         await content.mount(HomeView())
+        self.scheduler.start()
+        if self.webhooks:
+            try:
+                self.webhooks.start()
+            except OSError as e:
+                Logger.log(f"Webhook receiver could not start on port {self.webhooks.port}: {e}")
+                self.notify(
+                    f"Webhook receiver disabled, port {self.webhooks.port} is unavailable.", severity="warning"
+                )
+                self.webhooks = None
+
+    def on_unmount(self) -> None:
+        self.scheduler.stop()
+        if self.webhooks:
+            self.webhooks.stop()
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id not in ("home", "github", "settings"):
+        if event.button.id not in ("home", "github", "settings", "snapshots"):
             return
 
         content = self.query_one("#content", Container)
@@ -47,11 +76,14 @@ class MyApp(App):
             await content.mount(HomeView())
 
         elif event.button.id == "github":
-            await content.mount(GithubView(config.config.github))
+            await content.mount(GithubView(self.config.config.github, self.team_cache, self.team_graph, self.snapshots))
 
         elif event.button.id == "settings":
             await content.mount(SettingsView(self.config))
 
+        elif event.button.id == "snapshots":
+            await content.mount(SnapshotView(self.snapshots))
+
 
 if __name__ == "__main__":
     config = YAMLConfig("config.yaml")
@@ -6,4 +6,5 @@ class GithubConfig:
     active_team_members: List[str]
     organisation: str
     team: str
-    ignored_repositories: List[str]
\ No newline at end of file
+    ignored_repositories: List[str]
+    refresh_budget_share: float = 0.2
\ No newline at end of file
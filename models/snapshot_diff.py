@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class SnapshotDiff:
+    added: Dict[Any, Any] = field(default_factory=dict)
+    removed: List[Any] = field(default_factory=list)
+    changed: Dict[Any, Any] = field(default_factory=dict)
+    replaced: bool = False
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.replaced)
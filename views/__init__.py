@@ -1,3 +1,4 @@
 from .home_view import HomeView
 from .settings_view import SettingsView
-from .git_view import GithubView
\ No newline at end of file
+from .git_view import GithubView
+from .snapshot_view import SnapshotView
\ No newline at end of file
@@ -3,38 +3,104 @@
 import asyncio
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll, Vertical
-from textual.widgets import Button
+from textual.widgets import Button, Input
 from interface.JsonTreeViewer import JsonTreeViewer  # <-- you must have this installed
+from interface.ReportTable import ReportTable
 
 from models.github_config import GithubConfig
-from github import GitHubTeamRequests
+from github import GitHubTeamRequests, TeamGraph, TeamDataCache, TeamQueries, CommitActivity, BranchHygiene, SnapshotStore
+from github.team_cache import MEMBERS, REPOS, PULL_REQUESTS
+from models.snapshot_diff import SnapshotDiff
 
 
 class GithubView(VerticalScroll):
-    def __init__(self, config: GithubConfig):
+    def __init__(self, config: GithubConfig, cache: TeamDataCache = None, team_graph: TeamGraph = None,
+                 snapshots: SnapshotStore = None):
         super().__init__()
         self.content = None
         self.teams_button = None
         self.members_button = None
         self.team_repositories_button = None
+        self.team_pull_requests_button = None
+        self.commit_activity_button = None
+        self.branch_hygiene_button = None
+        self.graph_query = None
+        self.member_teams_button = None
+        self.repo_owners_button = None
+        self.shared_members_button = None
+        self.refresh_graph_button = None
+        self.viewer = None
+        self.viewer_key = None
         self.git_config = config
         self.gtr = GitHubTeamRequests(config.organisation, config.team)
+        self.cache = cache or TeamDataCache(config.team)
+        self.queries = TeamQueries(config, self.cache)
+        self.team_graph = team_graph or TeamGraph(config.organisation)
+        self.commit_activity = CommitActivity(config.organisation)
+        self.branch_hygiene = BranchHygiene(config.organisation)
+        self.snapshots = snapshots or SnapshotStore()
 
     def compose(self) -> ComposeResult:
         self.teams_button = Button("Organisation Teams", id="org_teams", variant="primary")
         self.members_button = Button("Team Members", id="team_members", variant="primary")
         self.team_repositories_button = Button("Team Repositories", id="team_repos", variant="primary")
+        self.team_pull_requests_button = Button("Team Pull Requests", id="team_prs", variant="primary")
+        self.commit_activity_button = Button("Commit Activity", id="commit_activity", variant="primary")
+        self.branch_hygiene_button = Button("Branch Hygiene", id="branch_hygiene", variant="primary")
+        self.graph_query = Input(placeholder="GitHub login or repository name…", id="graph_query")
+        self.member_teams_button = Button("Teams For Member", id="member_teams", variant="primary")
+        self.repo_owners_button = Button("Repository Owners", id="repo_owners", variant="primary")
+        self.shared_members_button = Button("Members Across Teams", id="shared_members", variant="primary")
+        self.refresh_graph_button = Button("Refresh Team Graph", id="refresh_graph", variant="primary")
         self.content = Vertical()
         yield self.teams_button
         yield self.members_button
         yield self.team_repositories_button
+        yield self.team_pull_requests_button
+        yield self.commit_activity_button
+        yield self.branch_hygiene_button
+        yield self.graph_query
+        yield self.member_teams_button
+        yield self.repo_owners_button
+        yield self.shared_members_button
+        yield self.refresh_graph_button
         yield self.content
 
+    def on_mount(self):
+        self.cache.subscribe(self.on_cache_changed)
+
+    def on_unmount(self):
+        self.cache.unsubscribe(self.on_cache_changed)
+
+    def on_cache_changed(self, key: str, diff: SnapshotDiff):
+        # Cache updates arrive from worker, scheduler and webhook threads.
+        if key == self.viewer_key:
+            self.app.call_from_thread(self.show_cached, key, diff)
+
+    def show_cached(self, key: str, diff: SnapshotDiff):
+        if self.viewer is not None and key == self.viewer_key:
+            self.viewer.apply_diff(self.cache.get(key), diff)
+
+    def mount_viewer(self, data, title, label_key=None, key=None):
+        self.viewer = JsonTreeViewer(data, title=title, label_key=label_key)
+        self.viewer_key = key
+        self.content.mount(self.viewer)
 
     async def run_with_prep_async(self, func, message):
         self.teams_button.display = False
         self.members_button.display = False
         self.team_repositories_button.display = False
+        self.team_pull_requests_button.display = False
+        self.commit_activity_button.display = False
+        self.branch_hygiene_button.display = False
+        self.graph_query.display = False
+        self.member_teams_button.display = False
+        self.repo_owners_button.display = False
+        self.shared_members_button.display = False
+        self.refresh_graph_button.display = False
+        # The viewer is about to be removed; stop routing cache updates to it.
+        self.viewer = None
+        self.viewer_key = None
         self.content.remove_children()
         from textual.widgets import Label
         loading = Label(message)
@@ -43,31 +109,112 @@ class GithubView(VerticalScroll):
         await loading.remove()
         return result
 
+    def fetch_cached(self, key: str, refresh):
+        # Listings kept fresh by the scheduler or webhooks are shown straight from the cache.
+        if self.cache.get(key) is None:
+            refresh()
+        return self.cache.get(key)
+
+    def fetch_teams(self):
+        teams = self.gtr.list_teams().data
+        self.snapshots.save("teams", teams, "name")
+        return teams
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button is self.teams_button:
             result = await self.run_with_prep_async(
-                self.gtr.list_teams,
+                self.fetch_teams,
                 f"Fetching teams for organisation {self.git_config.organisation}..."
             )
-            viewer = JsonTreeViewer(result.data, title="Organisation Teams", label_key="name")
-            self.content.mount(viewer)
+            self.mount_viewer(result, title="Organisation Teams", label_key="name")
             return
 
         if event.button is self.members_button:
             result = await self.run_with_prep_async(
-                self.gtr.get_team_members,
+                lambda: self.fetch_cached(MEMBERS, self.queries.refresh_members),
                 f"Fetching team members for team {self.git_config.team}..."
             )
-            viewer = JsonTreeViewer(result.data, title="Team Members", label_key="login")
-            self.content.mount(viewer)
+            self.mount_viewer(result, title="Team Members", label_key="login", key=MEMBERS)
             return
 
         if event.button is self.team_repositories_button:
             result = await self.run_with_prep_async(
-                self.gtr.get_team_repos,
+                lambda: self.fetch_cached(REPOS, self.queries.refresh_repos),
                 f"Fetching repositories for team {self.git_config.team}..."
             )
-            viewer = JsonTreeViewer(result.data, title="Team Repos", label_key="name")
-            self.content.mount(viewer)
+            self.mount_viewer(result, title="Team Repos", label_key="name", key=REPOS)
+            return
+
+        if event.button is self.team_pull_requests_button:
+            result = await self.run_with_prep_async(
+                lambda: self.fetch_cached(PULL_REQUESTS, self.queries.refresh_pull_requests),
+                f"Fetching open pull requests for team {self.git_config.team}..."
+            )
+            self.mount_viewer(result, title="Team Pull Requests", label_key="title", key=PULL_REQUESTS)
+            return
+
+        if event.button is self.commit_activity_button:
+            result = await self.run_with_prep_async(
+                lambda: self.commit_activity.update(self.queries.active_repo_names()).summary(
+                    self.git_config.active_team_members or None
+                ),
+                f"Fetching the last {self.commit_activity.days} days of commits for team {self.git_config.team}..."
+            )
+            if self.commit_activity.failed:
+                self.app.notify(
+                    f"Could not fetch commits for {', '.join(sorted(self.commit_activity.failed))}; "
+                    f"their activity may be missing or out of date; see debug.log.",
+                    severity="warning",
+                )
+            self.mount_viewer(result, title="Commit Activity", label_key="repo")
+            return
+
+        if event.button is self.branch_hygiene_button:
+            def scan():
+                repos = self.queries.active_repos()
+                return self.branch_hygiene.scan(repos).report([repo["name"] for repo in repos])
+
+            result = await self.run_with_prep_async(
+                scan,
+                f"Scanning branches for team {self.git_config.team}..."
+            )
+            if self.branch_hygiene.failed:
+                self.app.notify(
+                    f"Could not scan {', '.join(sorted(self.branch_hygiene.failed))}; see debug.log.", severity="warning"
+                )
+            self.content.mount(ReportTable(result, title="Branch Hygiene"))
+            return
+
+        if event.button is self.member_teams_button:
+            login = self.graph_query.value.strip()
+            result = await self.run_with_prep_async(
+                lambda: self.team_graph.refresh_if_stale().teams_for_member(login),
+                f"Looking up team graph for organisation {self.git_config.organisation}..."
+            )
+            self.mount_viewer(result, title=f"Teams For {login}", label_key="team")
+            return
+
+        if event.button is self.repo_owners_button:
+            repo = self.graph_query.value.strip()
+            result = await self.run_with_prep_async(
+                lambda: self.team_graph.refresh_if_stale().repo_owners(repo),
+                f"Looking up team graph for organisation {self.git_config.organisation}..."
+            )
+            self.mount_viewer(result, title=f"Owners Of {repo}", label_key="team")
+            return
+
+        if event.button is self.shared_members_button:
+            result = await self.run_with_prep_async(
+                lambda: self.team_graph.refresh_if_stale().shared_members(),
+                f"Looking up team graph for organisation {self.git_config.organisation}..."
+            )
+            self.mount_viewer(result, title="Members Across Teams")
+            return
+
+        if event.button is self.refresh_graph_button:
+            result = await self.run_with_prep_async(
+                lambda: self.team_graph.refresh().teams(),
+                f"Refreshing team graph for organisation {self.git_config.organisation}..."
+            )
+            self.mount_viewer(result, title="Team Graph Teams")
             return
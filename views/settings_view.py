@@ -52,6 +52,13 @@ class SettingsView(VerticalScroll):
             id="ignored_repos",
         )
 
+        yield Label("Background Refresh Budget", classes="title")
+        yield Label(
+            "Share of the GitHub rate limit (0-1) that background refreshes may use each hour.",
+            classes="description",
+        )
+        yield Input(str(self.config.config.github.refresh_budget_share), id="refresh_budget_share")
+
         yield Label("Local Settings", classes="section")
 
         yield Label("Active Working Directory", classes="title")
@@ -69,6 +76,14 @@ class SettingsView(VerticalScroll):
         if event.button.id != "save_settings":
             return
 
+        try:
+            refresh_budget_share = float(self.query_one("#refresh_budget_share", Input).value or 0.2)
+        except ValueError:
+            refresh_budget_share = None
+        if refresh_budget_share is None or not 0 < refresh_budget_share <= 1:
+            self.app.notify("Background Refresh Budget must be a number between 0 and 1.", severity="error")
+            return
+
         updated_config = {
             "github": {
                 "active-team-members":
@@ -79,6 +94,8 @@ class SettingsView(VerticalScroll):
                     self.query_one("#team", Input).value,
                 "ignored-repositories":
                     self.query_one("#ignored_repos", TextArea).text.splitlines(),
+                "refresh-budget-share":
+                    refresh_budget_share,
             },
             "local": {
                 "active-working-directory":
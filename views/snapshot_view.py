@@ -0,0 +1,72 @@
+from dataclasses import asdict
+
+from textual.containers import VerticalScroll, Vertical
+from textual.widgets import Button, Label, Select
+
+from github.snapshots import SnapshotStore
+from interface.JsonTreeViewer import JsonTreeViewer
+from interface.SnapshotViewer import SnapshotViewer
+
+
+class SnapshotView(VerticalScroll):
+    def __init__(self, store: SnapshotStore):
+        super().__init__()
+        self.store = store
+
+    def compose(self):
+        yield Label("Snapshots", classes="section")
+
+        yield Label("Listing", classes="title")
+        yield Select([(name, name) for name in self.store.names()], prompt="Choose a listing", id="snapshot_name")
+
+        yield Label("Snapshot", classes="title")
+        yield Select([], prompt="Choose a snapshot", id="snapshot_id")
+
+        yield Label("Compare With", classes="title")
+        yield Label(
+            "Optional older snapshot to diff the chosen snapshot against.",
+            classes="description",
+        )
+        yield Select([], prompt="Choose a snapshot", id="snapshot_base")
+
+        yield Button("Open Snapshot", id="open_snapshot", variant="primary")
+        yield Button("Diff Snapshots", id="diff_snapshots", variant="primary")
+        yield Vertical(id="snapshot_content")
+
+    def _value(self, select_id: str):
+        value = self.query_one(f"#{select_id}", Select).value
+        return value if isinstance(value, str) else None
+
+    def on_select_changed(self, event: Select.Changed):
+        if event.select.id != "snapshot_name":
+            return
+
+        name = self._value("snapshot_name")
+        options = [(snapshot_id, snapshot_id) for snapshot_id in reversed(self.store.snapshot_ids(name))] if name else []
+        self.query_one("#snapshot_id", Select).set_options(options)
+        self.query_one("#snapshot_base", Select).set_options(options)
+
+    async def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id not in ("open_snapshot", "diff_snapshots"):
+            return
+
+        name = self._value("snapshot_name")
+        snapshot_id = self._value("snapshot_id")
+        if not name or not snapshot_id:
+            self.app.notify("Choose a listing and a snapshot first.", severity="warning")
+            return
+
+        content = self.query_one("#snapshot_content", Vertical)
+        await content.remove_children()
+
+        if event.button.id == "open_snapshot":
+            await content.mount(SnapshotViewer(self.store.open(name, snapshot_id)))
+            return
+
+        base_id = self._value("snapshot_base")
+        if not base_id:
+            self.app.notify("Choose a snapshot to compare with.", severity="warning")
+            return
+
+        diff = self.store.diff(name, base_id, snapshot_id)
+        await content.mount(JsonTreeViewer(asdict(diff), title=f"{name}: {base_id} → {snapshot_id}"))